@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import re
+import sys
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+# Bump when the layout of sort_index.json changes so the frontend can ignore stale files
+SORT_INDEX_VERSION = 2
+
+
+def date_sort_key(date):
+    """Normalize a "YYYY" or "YYYY-MM" date into an integer that sorts chronologically.
+
+    The key is year * 100 + month. A bare year gets month 0, so it sorts just
+    before any dated month of the same year, and a missing date gets 0.
+    """
+    match = re.match(r'^\s*(\d{4})(?:-(\d{1,2}))?', str(date or ''))
+    if not match:
+        if date:
+            logging.warning(f"Could not parse date: {date}")
+        return 0
+    year = int(match.group(1))
+    month = int(match.group(2)) if match.group(2) else 0
+    return year * 100 + month
+
+
+def papers_fingerprint(papers, tags):
+    """32-bit FNV-1a hash of everything the sort orders read.
+
+    Covers the date, primaryTag and title of every paper plus the ordered parent
+    and child tag names in tags.json. Mirrors fingerprintPapers() in
+    src/utils/sortUtils.ts, which the frontend uses to reject a stale index.
+    """
+    paper_fields = [[paper.get('date') or '', paper.get('primaryTag') or '', paper.get('title') or ''] for paper in papers]
+    tag_fields = [[tag.get('name') or '', [child.get('name') or '' for child in tag.get('children') or []]] for tag in tags]
+    data = json.dumps([paper_fields, tag_fields], separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    fingerprint = 0x811c9dc5
+    for byte in data:
+        fingerprint ^= byte
+        fingerprint = (fingerprint * 0x01000193) & 0xffffffff
+    return fingerprint
+
+
+def parent_tag(paper):
+    return (paper.get('primaryTag') or '').split('/')[0]
+
+
+def child_tag(paper):
+    parts = (paper.get('primaryTag') or '').split('/')
+    return parts[1] if len(parts) > 1 else ''
+
+
+def title_key(paper):
+    # Approximates String.localeCompare, which orders case-insensitively first
+    title = paper.get('title') or ''
+    return (title.casefold(), title)
+
+
+def newest_order(date_keys):
+    # sorted() is stable, so papers with equal dates keep their papers.json order
+    return sorted(range(len(date_keys)), key=lambda i: -date_keys[i])
+
+
+def tag_based_order(papers, tags):
+    """Order paper indices the same way as the "Tag-based" sort.
+
+    Papers are grouped by parent tag and groups follow the order of tags.json.
+    Inside a group, papers are ordered by the position of their child tag under
+    that parent, then by title. Unknown tags go last.
+    """
+    parent_order = {tag['name']: index for index, tag in enumerate(tags)}
+    child_orders = {
+        tag['name']: {child['name']: index for index, child in enumerate(tag.get('children') or [])}
+        for tag in tags
+    }
+
+    groups = {}
+    for index, paper in enumerate(papers):
+        groups.setdefault(parent_tag(paper), []).append(index)
+
+    for parent, indices in groups.items():
+        child_order = child_orders.get(parent)
+        if child_order is not None:
+            indices.sort(key=lambda i: (child_order.get(child_tag(papers[i]), float('inf')), title_key(papers[i])))
+        else:
+            indices.sort(key=lambda i: title_key(papers[i]))
+
+    sorted_parents = sorted(groups, key=lambda parent: parent_order.get(parent, float('inf')))
+    return [index for parent in sorted_parents for index in groups[parent]]
+
+
+def build_sort_index(papers, tags):
+    """Precompute the static sort orders as permutations of papers.json indices."""
+    date_keys = [date_sort_key(paper.get('date')) for paper in papers]
+
+    return {
+        'version': SORT_INDEX_VERSION,
+        'count': len(papers),
+        'fingerprint': papers_fingerprint(papers, tags),
+        'dateKeys': date_keys,
+        'orders': {
+            'newest': newest_order(date_keys),
+            'tag-based': tag_based_order(papers, tags)
+        }
+    }
+
+
+if __name__ == "__main__":
+    papers_path = sys.argv[1] if len(sys.argv) > 1 else 'papers.json'
+    # tags.json and the default output live next to papers.json
+    data_dir = os.path.dirname(papers_path)
+    output_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_dir, 'sort_index.json')
+    try:
+        with open(papers_path, 'r') as f:
+            papers = json.load(f)
+        with open(os.path.join(data_dir, 'tags.json'), 'r') as f:
+            tags = json.load(f)
+
+        sort_index = build_sort_index(papers, tags)
+
+        with open(output_path, 'w') as f:
+            # Compact separators keep the integer arrays small
+            json.dump(sort_index, f, separators=(',', ':'), ensure_ascii=False)
+
+        logging.info(f"Wrote sort index for {len(papers)} papers to {output_path}")
+
+    except Exception as e:
+        logging.error(f"Fatal error building sort index: {e}")
+        sys.exit(1)
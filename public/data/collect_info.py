@@ -7,8 +7,12 @@ import re
 from datetime import datetime
 import random
 import sys
+import asyncio
+import contextlib
+import inspect
 from tqdm import tqdm  # For progress bars
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 
 # Configure logging
 logging.basicConfig(
@@ -18,9 +22,13 @@ logging.basicConfig(
 
 
 class RateLimiter:
-    def __init__(self, delay):
+    def __init__(self, delay, max_concurrent=1):
         self.delay = delay
+        self.max_concurrent = max_concurrent  # In-flight page loads allowed by the async backend
         self.last_request = 0
+        self._loop = None
+        self._lock = None
+        self._semaphore = None
 
     def wait(self):
         since_last = time.time() - self.last_request
@@ -28,12 +36,36 @@ class RateLimiter:
             time.sleep(self.delay - since_last)
         self.last_request = time.time()
 
+    def _bind_loop(self):
+        # asyncio primitives belong to one event loop, so recreate them for each run
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+    async def wait_async(self):
+        self._bind_loop()
+        async with self._lock:
+            since_last = time.time() - self.last_request
+            if since_last < self.delay:
+                await asyncio.sleep(self.delay - since_last)
+            self.last_request = time.time()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold one of the venue's concurrency slots, spacing request starts by `delay`."""
+        self._bind_loop()
+        async with self._semaphore:
+            await self.wait_async()
+            yield
+
 playwright_browser = None
-arxiv_limiter = RateLimiter(3)  # Reduced from 5s to 3s since we're using browser
-openreview_limiter = RateLimiter(2)
-acl_limiter = RateLimiter(2)
-mlr_limiter = RateLimiter(2)
-neurips_limiter = RateLimiter(2)
+arxiv_limiter = RateLimiter(3, max_concurrent=2)  # Reduced from 5s to 3s since we're using browser
+openreview_limiter = RateLimiter(2, max_concurrent=3)
+acl_limiter = RateLimiter(2, max_concurrent=3)
+mlr_limiter = RateLimiter(2, max_concurrent=3)
+neurips_limiter = RateLimiter(2, max_concurrent=3)
 
 def init_playwright():
     global playwright_browser
@@ -72,6 +104,93 @@ def safe_request(url, max_retries=5):
                 logging.error(f"Failed after {max_retries} attempts: {e}")
                 return None
 
+
+class ElementSnapshot:
+    """Detached copy of an element's text, attributes and selected descendants.
+
+    The async backend captures pages into snapshots so the same extract_*_info
+    functions can run against them as against a live sync Playwright page.
+    """
+
+    def __init__(self, text=None, attrs=None, children=None):
+        self.text = text
+        self.attrs = attrs or {}
+        self.children = children or {}
+
+    def text_content(self):
+        return self.text
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def query_selector(self, selector):
+        matches = self.query_selector_all(selector)
+        return matches[0] if matches else None
+
+    def query_selector_all(self, selector):
+        if selector not in self.children:
+            raise KeyError(f"Selector was not captured in snapshot: {selector}")
+        return list(self.children[selector])
+
+
+async def snapshot_elements(root, selectors):
+    """Capture `selectors` (selector -> options) below an async page or element handle.
+
+    Options: 'all' captures every match instead of the first one, 'attrs' lists
+    attributes to copy and 'children' is a nested selector spec.
+    """
+    children = {}
+    for selector, options in selectors.items():
+        try:
+            if options.get('all'):
+                handles = await root.query_selector_all(selector)
+            else:
+                handle = await root.query_selector(selector)
+                handles = [handle] if handle else []
+
+            elements = []
+            for handle in handles:
+                text = await handle.text_content()
+                attrs = {name: await handle.get_attribute(name) for name in options.get('attrs', [])}
+                nested = await snapshot_elements(handle, options.get('children', {}))
+                elements.append(ElementSnapshot(text, attrs, nested))
+        except Exception as e:
+            # A failed lookup only loses this selector, like the per-field try blocks of the sync path
+            logging.warning(f"Error capturing selector {selector}: {e}")
+            elements = []
+        children[selector] = elements
+    return children
+
+
+async def snapshot_page(page, selectors):
+    return ElementSnapshot(children=await snapshot_elements(page, selectors))
+
+
+async def goto_and_snapshot(browser, limiter, url, selectors, wait_until="networkidle", load_func=None):
+    """Load `url` in a fresh context within the venue's limits and snapshot it."""
+    async with limiter.slot():
+        # Create a new context for isolation
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            if load_func:
+                await load_func(page, url)
+            else:
+                await page.goto(url, wait_until=wait_until)
+            return await snapshot_page(page, selectors)
+        finally:
+            # Close the context to free resources
+            await context.close()
+
+ARXIV_SELECTORS = {
+    '.dateline': {},
+    '.submission-history': {},
+    '.authors a': {'all': True},
+    '.metatable .authors a': {'all': True},
+    '.abstract': {},
+    'blockquote.abstract': {'children': {'.descriptor': {}}},
+}
+
 def get_arxiv_info(arxiv_id):
     try:
         arxiv_limiter.wait()
@@ -86,108 +205,168 @@ def get_arxiv_info(arxiv_id):
         url = f"https://arxiv.org/abs/{arxiv_id}"
         page.goto(url, wait_until="networkidle")
         
-        # Extract the needed information
-        info = {}
+        info = extract_arxiv_info(page, arxiv_id)
         
-        # Date (from the submission history)
-        try:
-            # Check the dateline or submission history section
-            date_element = page.query_selector(".dateline") or page.query_selector(".submission-history")
-            if date_element:
-                date_text = date_element.text_content()
+        # Close the context to free resources
+        context.close()
+        
+        return info
+
+    except Exception as e:
+        logging.error(f"Error processing arXiv data: {e}")
+        return None
+
+async def get_arxiv_info_async(arxiv_id, browser):
+    try:
+        url = f"https://arxiv.org/abs/{arxiv_id}"
+        page = await goto_and_snapshot(browser, arxiv_limiter, url, ARXIV_SELECTORS)
+        return extract_arxiv_info(page, arxiv_id)
+
+    except Exception as e:
+        logging.error(f"Error processing arXiv data: {e}")
+        return None
+
+def extract_arxiv_info(page, arxiv_id):
+    # Extract the needed information
+    info = {}
+    
+    # Date (from the submission history)
+    try:
+        # Check the dateline or submission history section
+        date_element = page.query_selector(".dateline") or page.query_selector(".submission-history")
+        if date_element:
+            date_text = date_element.text_content()
+            
+            # First try to find the original submission date with the format:
+            # "[Submitted on 11 Oct 2023 (v1), last revised 14 Dec 2024 (this version, v4)]"
+            submission_match = re.search(r'Submitted on (\d{1,2} [A-Za-z]+ \d{4})', date_text)
+            if submission_match:
+                date_str = submission_match.group(1)
+                try:
+                    date_obj = datetime.strptime(date_str, "%d %b %Y")
+                    info['date'] = date_obj.strftime("%Y-%m")
+                except ValueError:
+                    logging.warning(f"Could not parse submission date format for {arxiv_id}: {date_str}")
+            # Fallback to other patterns if original submission not found
+            else:
+                # Try older format patterns
+                date_match = re.search(r'\[(?:Submitted|v\d+)\s+on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})\]', date_text)
+                if not date_match:
+                    date_match = re.search(r'\[v\d+\]\s+\w+,\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})', date_text)
                 
-                # First try to find the original submission date with the format:
-                # "[Submitted on 11 Oct 2023 (v1), last revised 14 Dec 2024 (this version, v4)]"
-                submission_match = re.search(r'Submitted on (\d{1,2} [A-Za-z]+ \d{4})', date_text)
-                if submission_match:
-                    date_str = submission_match.group(1)
+                if date_match:
+                    date_str = date_match.group(1)
                     try:
                         date_obj = datetime.strptime(date_str, "%d %b %Y")
                         info['date'] = date_obj.strftime("%Y-%m")
                     except ValueError:
-                        logging.warning(f"Could not parse submission date format for {arxiv_id}: {date_str}")
-                # Fallback to other patterns if original submission not found
+                        logging.warning(f"Could not parse date format for {arxiv_id}: {date_str}")
                 else:
-                    # Try older format patterns
-                    date_match = re.search(r'\[(?:Submitted|v\d+)\s+on\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})\]', date_text)
-                    if not date_match:
-                        date_match = re.search(r'\[v\d+\]\s+\w+,\s+(\d{1,2}\s+[A-Za-z]+\s+\d{4})', date_text)
-                    
-                    if date_match:
-                        date_str = date_match.group(1)
+                    # Extract any date in the format "DD Mon YYYY"
+                    any_date_match = re.search(r'(\d{1,2} [A-Za-z]+ \d{4})', date_text)
+                    if any_date_match:
+                        date_str = any_date_match.group(1)
                         try:
                             date_obj = datetime.strptime(date_str, "%d %b %Y")
                             info['date'] = date_obj.strftime("%Y-%m")
+                            logging.info(f"Using first date found in dateline: {date_str}")
                         except ValueError:
-                            logging.warning(f"Could not parse date format for {arxiv_id}: {date_str}")
+                            logging.warning(f"Could not parse any date format for {arxiv_id}: {date_str}")
                     else:
-                        # Extract any date in the format "DD Mon YYYY"
-                        any_date_match = re.search(r'(\d{1,2} [A-Za-z]+ \d{4})', date_text)
-                        if any_date_match:
-                            date_str = any_date_match.group(1)
-                            try:
-                                date_obj = datetime.strptime(date_str, "%d %b %Y")
-                                info['date'] = date_obj.strftime("%Y-%m")
-                                logging.info(f"Using first date found in dateline: {date_str}")
-                            except ValueError:
-                                logging.warning(f"Could not parse any date format for {arxiv_id}: {date_str}")
-                        else:
-                            logging.warning(f"Could not find any date pattern in: {date_text}")
-            else:
-                logging.warning(f"No date element found for {arxiv_id}")
-        except Exception as e:
-            logging.warning(f"Error extracting arXiv date: {e}")
-        
-        # Authors
-        try:
-            authors = []
-            # Try the modern class structure first
-            author_elements = page.query_selector_all(".authors a")
-            if not author_elements or len(author_elements) == 0:
-                # Try alternative selectors if needed
-                author_elements = page.query_selector_all(".metatable .authors a")
-            
-            for author_elem in author_elements:
-                author_name = author_elem.text_content().strip()
-                if author_name:
-                    authors.append(author_name)
-            
-            info['authors'] = authors if authors else None
-        except Exception as e:
-            logging.warning(f"Error extracting arXiv authors: {e}")
-        
-        # Abstract
-        try:
-            # Try the modern class structure first
-            abstract_elem = page.query_selector(".abstract")
+                        logging.warning(f"Could not find any date pattern in: {date_text}")
+        else:
+            logging.warning(f"No date element found for {arxiv_id}")
+    except Exception as e:
+        logging.warning(f"Error extracting arXiv date: {e}")
+    
+    # Authors
+    try:
+        authors = []
+        # Try the modern class structure first
+        author_elements = page.query_selector_all(".authors a")
+        if not author_elements or len(author_elements) == 0:
+            # Try alternative selectors if needed
+            author_elements = page.query_selector_all(".metatable .authors a")
+        
+        for author_elem in author_elements:
+            author_name = author_elem.text_content().strip()
+            if author_name:
+                authors.append(author_name)
+        
+        info['authors'] = authors if authors else None
+    except Exception as e:
+        logging.warning(f"Error extracting arXiv authors: {e}")
+    
+    # Abstract
+    try:
+        # Try the modern class structure first
+        abstract_elem = page.query_selector(".abstract")
+        if abstract_elem:
+            abstract_text = abstract_elem.text_content()
+            # Remove the "Abstract: " prefix if present
+            abstract_text = re.sub(r'^Abstract:\s*', '', abstract_text).strip().replace('Abstract:', '').strip()
+            info['abstract'] = abstract_text
+        else:
+            # Try alternative selectors
+            abstract_elem = page.query_selector("blockquote.abstract")
             if abstract_elem:
-                abstract_text = abstract_elem.text_content()
-                # Remove the "Abstract: " prefix if present
-                abstract_text = re.sub(r'^Abstract:\s*', '', abstract_text).strip().replace('Abstract:', '').strip()
-                info['abstract'] = abstract_text
-            else:
-                # Try alternative selectors
-                abstract_elem = page.query_selector("blockquote.abstract")
-                if abstract_elem:
-                    # The span with class "descriptor" contains "Abstract:" text which we want to exclude
-                    descriptor = abstract_elem.query_selector(".descriptor")
-                    if descriptor:
-                        descriptor_text = descriptor.text_content()
-                        abstract_text = abstract_elem.text_content()
-                        # Remove the descriptor text from the abstract
-                        abstract_text = abstract_text.replace(descriptor_text, "").strip()
-                        info['abstract'] = abstract_text
-        except Exception as e:
-            logging.warning(f"Error extracting arXiv abstract: {e}")
-        
-        # Close the context to free resources
-        context.close()
-        
-        return info
-
+                # The span with class "descriptor" contains "Abstract:" text which we want to exclude
+                descriptor = abstract_elem.query_selector(".descriptor")
+                if descriptor:
+                    descriptor_text = descriptor.text_content()
+                    abstract_text = abstract_elem.text_content()
+                    # Remove the descriptor text from the abstract
+                    abstract_text = abstract_text.replace(descriptor_text, "").strip()
+                    info['abstract'] = abstract_text
     except Exception as e:
-        logging.error(f"Error processing arXiv data: {e}")
-        return None
+        logging.warning(f"Error extracting arXiv abstract: {e}")
+    
+    return info
+
+OPENREVIEW_SELECTORS = {
+    '.forum-meta .date': {},
+    'div:has-text("Date:") + div': {},
+    '.forum-authors a': {'all': True},
+    'div:has-text("Authors:") + div': {},
+    'div:has(.note-content-field:has-text("Abstract:")) .note-content-value.markdown-rendered': {},
+    'div:has-text("Abstract:") + div': {},
+}
+
+def load_openreview_page(page, url):
+    # First navigate with domcontentloaded which is faster
+    page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    
+    # Then wait for critical elements to appear rather than networkidle
+    try:
+        # Wait for either the forum content to load OR the error message if paper doesn't exist
+        page.wait_for_selector("div.forum-container, div.error-container", timeout=20000)
+        
+        # Additional wait for the authors to appear if the page exists
+        authors_selector = page.query_selector(".forum-authors, div:has-text('Authors:')")
+        if authors_selector:
+            # Give a little more time for content to settle
+            page.wait_for_timeout(1000)
+    except Exception as e:
+        logging.warning(f"Timeout waiting for OpenReview page elements: {e}")
+        # Continue anyway with what we have
+
+async def load_openreview_page_async(page, url):
+    # First navigate with domcontentloaded which is faster
+    await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    
+    # Then wait for critical elements to appear rather than networkidle
+    try:
+        # Wait for either the forum content to load OR the error message if paper doesn't exist
+        await page.wait_for_selector("div.forum-container, div.error-container", timeout=20000)
+        
+        # Additional wait for the authors to appear if the page exists
+        authors_selector = await page.query_selector(".forum-authors, div:has-text('Authors:')")
+        if authors_selector:
+            # Give a little more time for content to settle
+            await page.wait_for_timeout(1000)
+    except Exception as e:
+        logging.warning(f"Timeout waiting for OpenReview page elements: {e}")
+        # Continue anyway with what we have
 
 def get_openreview_info(openreview_id):
     try:
@@ -201,86 +380,9 @@ def get_openreview_info(openreview_id):
         
         # Navigate to the OpenReview page with a more reliable load strategy
         url = f"https://openreview.net/forum?id={openreview_id}"
+        load_openreview_page(page, url)
         
-        # First navigate with domcontentloaded which is faster
-        page.goto(url, wait_until="domcontentloaded", timeout=30000)
-        
-        # Then wait for critical elements to appear rather than networkidle
-        try:
-            # Wait for either the forum content to load OR the error message if paper doesn't exist
-            page.wait_for_selector("div.forum-container, div.error-container", timeout=20000)
-            
-            # Additional wait for the authors to appear if the page exists
-            authors_selector = page.query_selector(".forum-authors, div:has-text('Authors:')")
-            if authors_selector:
-                # Give a little more time for content to settle
-                page.wait_for_timeout(1000)
-        except Exception as e:
-            logging.warning(f"Timeout waiting for OpenReview page elements: {e}")
-            # Continue anyway with what we have
-        
-        # Extract the needed information
-        info = {}
-        
-        # Extract date
-        try:
-            # Look for the publication date in the forum-meta section
-            date_span = page.query_selector(".forum-meta .date")
-            if date_span:
-                date_text = date_span.text_content()
-                year_match = re.search(r'(\d{4})', date_text)
-                if year_match:
-                    info['date'] = year_match.group(1)
-            
-            # Fallback: Look for date in other potential locations
-            if not info.get('date'):
-                date_div = page.query_selector('div:has-text("Date:") + div')
-                if date_div:
-                    date_text = date_div.text_content()
-                    year_match = re.search(r'\d{4}', date_text)
-                    info['date'] = year_match.group(0) if year_match else None
-        except Exception as e:
-            logging.warning(f"Error extracting OpenReview date: {e}")
-
-        # Extract authors
-        try:
-            # Try forum-authors class first (modern layout)
-            authors = []
-            author_elements = page.query_selector_all(".forum-authors a")
-            
-            # If no authors found, try alternative layout
-            if not author_elements or len(author_elements) == 0:
-                authors_div = page.query_selector('div:has-text("Authors:") + div')
-                if authors_div:
-                    authors_text = authors_div.text_content()
-                    # Split by commas and clean up
-                    authors = [a.strip() for a in authors_text.split(',')]
-            else:
-                # Extract from forum-authors elements
-                for author_elem in author_elements:
-                    author_name = author_elem.text_content().strip()
-                    if author_name:
-                        authors.append(author_name)
-            
-            info['authors'] = authors if authors else None
-        except Exception as e:
-            logging.warning(f"Error extracting OpenReview authors: {e}")
-
-        # Extract abstract
-        try:
-            # Try the note-content-value with markdown-rendered class first
-            abstract_div = page.query_selector('div:has(.note-content-field:has-text("Abstract:")) .note-content-value.markdown-rendered')
-            if abstract_div:
-                abstract = abstract_div.text_content().strip()
-                info['abstract'] = abstract if abstract else None
-            else:
-                # Try alternative layout
-                abstract_div = page.query_selector('div:has-text("Abstract:") + div')
-                if abstract_div:
-                    abstract = abstract_div.text_content().strip()
-                    info['abstract'] = abstract if abstract else None
-        except Exception as e:
-            logging.warning(f"Error extracting OpenReview abstract: {e}")
+        info = extract_openreview_info(page, openreview_id)
         
         # Close the context to free resources
         context.close()
@@ -291,6 +393,89 @@ def get_openreview_info(openreview_id):
         logging.error(f"Error processing OpenReview data: {e}")
         return None
 
+async def get_openreview_info_async(openreview_id, browser):
+    try:
+        url = f"https://openreview.net/forum?id={openreview_id}"
+        page = await goto_and_snapshot(browser, openreview_limiter, url, OPENREVIEW_SELECTORS, load_func=load_openreview_page_async)
+        return extract_openreview_info(page, openreview_id)
+
+    except Exception as e:
+        logging.error(f"Error processing OpenReview data: {e}")
+        return None
+
+def extract_openreview_info(page, openreview_id):
+    # Extract the needed information
+    info = {}
+    
+    # Extract date
+    try:
+        # Look for the publication date in the forum-meta section
+        date_span = page.query_selector(".forum-meta .date")
+        if date_span:
+            date_text = date_span.text_content()
+            year_match = re.search(r'(\d{4})', date_text)
+            if year_match:
+                info['date'] = year_match.group(1)
+        
+        # Fallback: Look for date in other potential locations
+        if not info.get('date'):
+            date_div = page.query_selector('div:has-text("Date:") + div')
+            if date_div:
+                date_text = date_div.text_content()
+                year_match = re.search(r'\d{4}', date_text)
+                info['date'] = year_match.group(0) if year_match else None
+    except Exception as e:
+        logging.warning(f"Error extracting OpenReview date: {e}")
+
+    # Extract authors
+    try:
+        # Try forum-authors class first (modern layout)
+        authors = []
+        author_elements = page.query_selector_all(".forum-authors a")
+        
+        # If no authors found, try alternative layout
+        if not author_elements or len(author_elements) == 0:
+            authors_div = page.query_selector('div:has-text("Authors:") + div')
+            if authors_div:
+                authors_text = authors_div.text_content()
+                # Split by commas and clean up
+                authors = [a.strip() for a in authors_text.split(',')]
+        else:
+            # Extract from forum-authors elements
+            for author_elem in author_elements:
+                author_name = author_elem.text_content().strip()
+                if author_name:
+                    authors.append(author_name)
+        
+        info['authors'] = authors if authors else None
+    except Exception as e:
+        logging.warning(f"Error extracting OpenReview authors: {e}")
+
+    # Extract abstract
+    try:
+        # Try the note-content-value with markdown-rendered class first
+        abstract_div = page.query_selector('div:has(.note-content-field:has-text("Abstract:")) .note-content-value.markdown-rendered')
+        if abstract_div:
+            abstract = abstract_div.text_content().strip()
+            info['abstract'] = abstract if abstract else None
+        else:
+            # Try alternative layout
+            abstract_div = page.query_selector('div:has-text("Abstract:") + div')
+            if abstract_div:
+                abstract = abstract_div.text_content().strip()
+                info['abstract'] = abstract if abstract else None
+    except Exception as e:
+        logging.warning(f"Error extracting OpenReview abstract: {e}")
+    
+    return info
+
+ACL_SELECTORS = {
+    'dt:has-text("Year:") + dd': {},
+    '#citeBibtexContent': {},
+    'p.lead a': {'all': True},
+    'div.acl-abstract span': {},
+}
+
 def get_acl_info(acl_id):
     try:
         acl_limiter.wait()
@@ -305,84 +490,7 @@ def get_acl_info(acl_id):
         url = f"https://aclanthology.org/{acl_id}/"
         page.goto(url, wait_until="networkidle")
         
-        # Extract the needed information
-        info = {}
-        
-        # Extract year
-        try:
-            # Look for year information in the dl section
-            year_element = page.query_selector('dt:has-text("Year:") + dd')
-            if year_element:
-                info['date'] = year_element.text_content().strip()
-            
-            # If not found, try to find in any element with year pattern
-            if not info.get('date'):
-                # Try to find from the BibTeX content
-                bibtex_elem = page.query_selector('#citeBibtexContent')
-                if bibtex_elem:
-                    bibtex_text = bibtex_elem.text_content()
-                    year_match = re.search(r'year\s*=\s*\{(\d{4})', bibtex_text)
-                    if year_match:
-                        info['date'] = year_match.group(1)
-                
-                # As a fallback, try to extract from the anthology ID
-                if not info.get('date') and acl_id:
-                    # ACL IDs often contain year information (e.g., 2024.acl-long.572)
-                    year_match = re.search(r'(\d{4})', acl_id)
-                    if year_match:
-                        info['date'] = year_match.group(1)
-        except Exception as e:
-            logging.warning(f"Error extracting ACL year: {e}")
-        
-        # Extract authors
-        try:
-            authors = []
-            # Try author links in lead paragraph
-            author_elements = page.query_selector_all('p.lead a')
-            if author_elements and len(author_elements) > 0:
-                for author_elem in author_elements:
-                    author_name = author_elem.text_content().strip()
-                    if author_name and author_name not in ['', ',']:
-                        authors.append(author_name)
-            
-            # If not found, try to extract from BibTeX
-            if not authors:
-                bibtex_elem = page.query_selector('#citeBibtexContent')
-                if bibtex_elem:
-                    bibtex_text = bibtex_elem.text_content()
-                    author_match = re.search(r'author\s*=\s*\{([^}]+)\}', bibtex_text)
-                    if author_match:
-                        authors_text = author_match.group(1)
-                        # Handle different formats: "and" or "," separators
-                        authors_text = authors_text.replace(' and ', ', ')
-                        authors = [author.strip() for author in authors_text.split(',')]
-            
-            # Filter out empty author names and store
-            authors = [a for a in authors if a]
-            if authors:
-                info['authors'] = authors
-        except Exception as e:
-            logging.warning(f"Error extracting ACL authors: {e}")
-        
-        # Extract abstract
-        try:
-            # Try the abstract section
-            abstract_div = page.query_selector('div.acl-abstract span')
-            if abstract_div:
-                abstract_text = abstract_div.text_content().strip()
-                if abstract_text:
-                    info['abstract'] = abstract_text
-            
-            # If not found, try to extract from BibTeX
-            if not info.get('abstract'):
-                bibtex_elem = page.query_selector('#citeBibtexContent')
-                if bibtex_elem:
-                    bibtex_text = bibtex_elem.text_content()
-                    abstract_match = re.search(r'abstract\s*=\s*\{([^}]+)\}', bibtex_text)
-                    if abstract_match:
-                        info['abstract'] = abstract_match.group(1).strip()
-        except Exception as e:
-            logging.warning(f"Error extracting ACL abstract: {e}")
+        info = extract_acl_info(page, acl_id)
         
         # Close the context to free resources
         context.close()
@@ -393,6 +501,105 @@ def get_acl_info(acl_id):
         logging.error(f"Error processing ACL data: {e}")
         return None
 
+async def get_acl_info_async(acl_id, browser):
+    try:
+        url = f"https://aclanthology.org/{acl_id}/"
+        page = await goto_and_snapshot(browser, acl_limiter, url, ACL_SELECTORS)
+        return extract_acl_info(page, acl_id)
+
+    except Exception as e:
+        logging.error(f"Error processing ACL data: {e}")
+        return None
+
+def extract_acl_info(page, acl_id):
+    # Extract the needed information
+    info = {}
+    
+    # Extract year
+    try:
+        # Look for year information in the dl section
+        year_element = page.query_selector('dt:has-text("Year:") + dd')
+        if year_element:
+            info['date'] = year_element.text_content().strip()
+        
+        # If not found, try to find in any element with year pattern
+        if not info.get('date'):
+            # Try to find from the BibTeX content
+            bibtex_elem = page.query_selector('#citeBibtexContent')
+            if bibtex_elem:
+                bibtex_text = bibtex_elem.text_content()
+                year_match = re.search(r'year\s*=\s*\{(\d{4})', bibtex_text)
+                if year_match:
+                    info['date'] = year_match.group(1)
+            
+            # As a fallback, try to extract from the anthology ID
+            if not info.get('date') and acl_id:
+                # ACL IDs often contain year information (e.g., 2024.acl-long.572)
+                year_match = re.search(r'(\d{4})', acl_id)
+                if year_match:
+                    info['date'] = year_match.group(1)
+    except Exception as e:
+        logging.warning(f"Error extracting ACL year: {e}")
+    
+    # Extract authors
+    try:
+        authors = []
+        # Try author links in lead paragraph
+        author_elements = page.query_selector_all('p.lead a')
+        if author_elements and len(author_elements) > 0:
+            for author_elem in author_elements:
+                author_name = author_elem.text_content().strip()
+                if author_name and author_name not in ['', ',']:
+                    authors.append(author_name)
+        
+        # If not found, try to extract from BibTeX
+        if not authors:
+            bibtex_elem = page.query_selector('#citeBibtexContent')
+            if bibtex_elem:
+                bibtex_text = bibtex_elem.text_content()
+                author_match = re.search(r'author\s*=\s*\{([^}]+)\}', bibtex_text)
+                if author_match:
+                    authors_text = author_match.group(1)
+                    # Handle different formats: "and" or "," separators
+                    authors_text = authors_text.replace(' and ', ', ')
+                    authors = [author.strip() for author in authors_text.split(',')]
+        
+        # Filter out empty author names and store
+        authors = [a for a in authors if a]
+        if authors:
+            info['authors'] = authors
+    except Exception as e:
+        logging.warning(f"Error extracting ACL authors: {e}")
+    
+    # Extract abstract
+    try:
+        # Try the abstract section
+        abstract_div = page.query_selector('div.acl-abstract span')
+        if abstract_div:
+            abstract_text = abstract_div.text_content().strip()
+            if abstract_text:
+                info['abstract'] = abstract_text
+        
+        # If not found, try to extract from BibTeX
+        if not info.get('abstract'):
+            bibtex_elem = page.query_selector('#citeBibtexContent')
+            if bibtex_elem:
+                bibtex_text = bibtex_elem.text_content()
+                abstract_match = re.search(r'abstract\s*=\s*\{([^}]+)\}', bibtex_text)
+                if abstract_match:
+                    info['abstract'] = abstract_match.group(1).strip()
+    except Exception as e:
+        logging.warning(f"Error extracting ACL abstract: {e}")
+    
+    return info
+
+MLR_SELECTORS = {
+    '#bibtex': {},
+    '#info': {},
+    'span.authors': {},
+    '#abstract': {},
+}
+
 def get_mlr_info(mlr_id):
     try:
         mlr_limiter.wait()
@@ -407,76 +614,8 @@ def get_mlr_info(mlr_id):
         url = f"https://proceedings.mlr.press/{mlr_id}"
         page.goto(url, wait_until="networkidle")
         
-        # Extract the needed information
-        info = {}
+        info = extract_mlr_info(page, mlr_id)
         
-        # Extract date/year
-        try:
-            # Check bibtex for date information
-            bibtex_elem = page.query_selector('#bibtex')
-            if bibtex_elem:
-                bibtex_text = bibtex_elem.text_content()
-                year_match = re.search(r'year\s*=\s*\{(\d{4})\}', bibtex_text)
-                if year_match:
-                    info['date'] = year_match.group(1)
-            
-            # Fallback to info div
-            if not info.get('date'):
-                info_div = page.query_selector('#info')
-                if info_div:
-                    info_text = info_div.text_content()
-                    year_match = re.search(r'(\d{4})', info_text)
-                    if year_match:
-                        info['date'] = year_match.group(1)
-        except Exception as e:
-            logging.warning(f"Error extracting MLR date: {e}")
-        
-        # Extract authors
-        try:
-            # Look for authors in the span.authors element
-            authors_span = page.query_selector('span.authors')
-            if authors_span:
-                authors_text = authors_span.text_content().strip()
-                # Split by commas and ampersands
-                authors_text = authors_text.replace('&', ',')
-                authors = [author.strip() for author in authors_text.split(',')]
-                # Filter out empty strings
-                authors = [author for author in authors if author]
-                info['authors'] = authors if authors else None
-                
-            # Fallback to bibtex
-            if not info.get('authors'):
-                bibtex_elem = page.query_selector('#bibtex')
-                if bibtex_elem:
-                    bibtex_text = bibtex_elem.text_content()
-                    author_match = re.search(r'author\s*=\s*\{([^}]+)\}', bibtex_text)
-                    if author_match:
-                        authors_text = author_match.group(1)
-                        # Handle different formats: "and" or "," separators
-                        authors_text = authors_text.replace(' and ', ', ')
-                        authors = [author.strip() for author in authors_text.split(',')]
-                        info['authors'] = authors if authors else None
-        except Exception as e:
-            logging.warning(f"Error extracting MLR authors: {e}")
-        
-        # Extract abstract
-        try:
-            abstract_div = page.query_selector('#abstract')
-            if abstract_div:
-                abstract_text = abstract_div.text_content().strip()
-                info['abstract'] = abstract_text if abstract_text else None
-            
-            # Fallback to bibtex
-            if not info.get('abstract'):
-                bibtex_elem = page.query_selector('#bibtex')
-                if bibtex_elem:
-                    bibtex_text = bibtex_elem.text_content()
-                    abstract_match = re.search(r'abstract\s*=\s*\{([^}]+)\}', bibtex_text)
-                    if abstract_match:
-                        info['abstract'] = abstract_match.group(1)
-        except Exception as e:
-            logging.warning(f"Error extracting MLR abstract: {e}")
-            
         # Close the context to free resources
         context.close()
         
@@ -486,6 +625,95 @@ def get_mlr_info(mlr_id):
         logging.error(f"Error processing MLR data: {e}")
         return None
 
+async def get_mlr_info_async(mlr_id, browser):
+    try:
+        url = f"https://proceedings.mlr.press/{mlr_id}"
+        page = await goto_and_snapshot(browser, mlr_limiter, url, MLR_SELECTORS)
+        return extract_mlr_info(page, mlr_id)
+
+    except Exception as e:
+        logging.error(f"Error processing MLR data: {e}")
+        return None
+
+def extract_mlr_info(page, mlr_id):
+    # Extract the needed information
+    info = {}
+    
+    # Extract date/year
+    try:
+        # Check bibtex for date information
+        bibtex_elem = page.query_selector('#bibtex')
+        if bibtex_elem:
+            bibtex_text = bibtex_elem.text_content()
+            year_match = re.search(r'year\s*=\s*\{(\d{4})\}', bibtex_text)
+            if year_match:
+                info['date'] = year_match.group(1)
+        
+        # Fallback to info div
+        if not info.get('date'):
+            info_div = page.query_selector('#info')
+            if info_div:
+                info_text = info_div.text_content()
+                year_match = re.search(r'(\d{4})', info_text)
+                if year_match:
+                    info['date'] = year_match.group(1)
+    except Exception as e:
+        logging.warning(f"Error extracting MLR date: {e}")
+    
+    # Extract authors
+    try:
+        # Look for authors in the span.authors element
+        authors_span = page.query_selector('span.authors')
+        if authors_span:
+            authors_text = authors_span.text_content().strip()
+            # Split by commas and ampersands
+            authors_text = authors_text.replace('&', ',')
+            authors = [author.strip() for author in authors_text.split(',')]
+            # Filter out empty strings
+            authors = [author for author in authors if author]
+            info['authors'] = authors if authors else None
+            
+        # Fallback to bibtex
+        if not info.get('authors'):
+            bibtex_elem = page.query_selector('#bibtex')
+            if bibtex_elem:
+                bibtex_text = bibtex_elem.text_content()
+                author_match = re.search(r'author\s*=\s*\{([^}]+)\}', bibtex_text)
+                if author_match:
+                    authors_text = author_match.group(1)
+                    # Handle different formats: "and" or "," separators
+                    authors_text = authors_text.replace(' and ', ', ')
+                    authors = [author.strip() for author in authors_text.split(',')]
+                    info['authors'] = authors if authors else None
+    except Exception as e:
+        logging.warning(f"Error extracting MLR authors: {e}")
+    
+    # Extract abstract
+    try:
+        abstract_div = page.query_selector('#abstract')
+        if abstract_div:
+            abstract_text = abstract_div.text_content().strip()
+            info['abstract'] = abstract_text if abstract_text else None
+        
+        # Fallback to bibtex
+        if not info.get('abstract'):
+            bibtex_elem = page.query_selector('#bibtex')
+            if bibtex_elem:
+                bibtex_text = bibtex_elem.text_content()
+                abstract_match = re.search(r'abstract\s*=\s*\{([^}]+)\}', bibtex_text)
+                if abstract_match:
+                    info['abstract'] = abstract_match.group(1)
+    except Exception as e:
+        logging.warning(f"Error extracting MLR abstract: {e}")
+    
+    return info
+
+NEURIPS_SELECTORS = {
+    'a[href*="/paper_files/paper/"]': {'attrs': ['href']},
+    'h4:has-text("Authors") + p': {},
+    'h4:has-text("Abstract") + p': {},
+}
+
 def get_neurips_info(neurips_id):
     try:
         neurips_limiter.wait()
@@ -500,74 +728,7 @@ def get_neurips_info(neurips_id):
         url = f"https://proceedings.neurips.cc/paper/{neurips_id}"
         page.goto(url, wait_until="networkidle")
         
-        # Extract the needed information
-        info = {}
-        
-        # Extract year/date
-        try:
-            # Look for year in the conference link
-            conference_link = page.query_selector('a[href*="/paper_files/paper/"]')
-            if conference_link:
-                link_text = conference_link.text_content().strip()
-                year_match = re.search(r'NeurIPS\s+(\d{4})', link_text, re.IGNORECASE)
-                if year_match:
-                    info['date'] = year_match.group(1)
-            
-            # Fallback: extract from URL or paper ID
-            if not info.get('date'):
-                # Try to extract from the paper URL
-                year_match = re.search(r'/paper/(\d{4})/', neurips_id)
-                if year_match:
-                    info['date'] = year_match.group(1)
-                # Try to extract from the conference link href
-                elif conference_link:
-                    href = conference_link.get_attribute('href')
-                    if href:
-                        year_match = re.search(r'/paper_files/paper/(\d{4})/?', href)
-                        if year_match:
-                            info['date'] = year_match.group(1)
-        except Exception as e:
-            logging.warning(f"Error extracting NeurIPS year: {e}")
-        
-        # Extract authors
-        try:
-            # Try to find the authors section
-            authors_p = page.query_selector('h4:has-text("Authors") + p')
-            if authors_p:
-                authors_text = authors_p.text_content().strip()
-                # Remove italic formatting if present
-                authors_text = authors_text.replace('<i>', '').replace('</i>', '')
-                # Split by commas and handle possible "and" between last two authors
-                if ' and ' in authors_text:
-                    parts = authors_text.split(' and ')
-                    if ',' in parts[0]:
-                        # There are multiple authors with commas
-                        authors_before_and = parts[0].split(',')
-                        authors = [a.strip() for a in authors_before_and] + [parts[1].strip()]
-                    else:
-                        # Just two authors separated by "and"
-                        authors = [parts[0].strip(), parts[1].strip()]
-                else:
-                    # Split by commas
-                    authors = [a.strip() for a in authors_text.split(',')]
-                
-                # Filter out empty strings and remove any HTML tags
-                authors = [re.sub(r'<[^>]+>', '', a) for a in authors if a]
-                info['authors'] = authors if authors else None
-        except Exception as e:
-            logging.warning(f"Error extracting NeurIPS authors: {e}")
-        
-        # Extract abstract
-        try:
-            # Find the abstract section
-            abstract_p = page.query_selector('h4:has-text("Abstract") + p')
-            if abstract_p:
-                abstract_text = abstract_p.text_content().strip()
-                # Clean up MathJax elements if needed
-                abstract_text = re.sub(r'<span class="MathJax[^>]+>.*?</span>', '', abstract_text)
-                info['abstract'] = abstract_text
-        except Exception as e:
-            logging.warning(f"Error extracting NeurIPS abstract: {e}")
+        info = extract_neurips_info(page, neurips_id)
         
         # Close the context to free resources
         context.close()
@@ -578,6 +739,88 @@ def get_neurips_info(neurips_id):
         logging.error(f"Error processing NeurIPS data: {e}")
         return None
 
+async def get_neurips_info_async(neurips_id, browser):
+    try:
+        url = f"https://proceedings.neurips.cc/paper/{neurips_id}"
+        page = await goto_and_snapshot(browser, neurips_limiter, url, NEURIPS_SELECTORS)
+        return extract_neurips_info(page, neurips_id)
+
+    except Exception as e:
+        logging.error(f"Error processing NeurIPS data: {e}")
+        return None
+
+def extract_neurips_info(page, neurips_id):
+    # Extract the needed information
+    info = {}
+    
+    # Extract year/date
+    try:
+        # Look for year in the conference link
+        conference_link = page.query_selector('a[href*="/paper_files/paper/"]')
+        if conference_link:
+            link_text = conference_link.text_content().strip()
+            year_match = re.search(r'NeurIPS\s+(\d{4})', link_text, re.IGNORECASE)
+            if year_match:
+                info['date'] = year_match.group(1)
+        
+        # Fallback: extract from URL or paper ID
+        if not info.get('date'):
+            # Try to extract from the paper URL
+            year_match = re.search(r'/paper/(\d{4})/', neurips_id)
+            if year_match:
+                info['date'] = year_match.group(1)
+            # Try to extract from the conference link href
+            elif conference_link:
+                href = conference_link.get_attribute('href')
+                if href:
+                    year_match = re.search(r'/paper_files/paper/(\d{4})/?', href)
+                    if year_match:
+                        info['date'] = year_match.group(1)
+    except Exception as e:
+        logging.warning(f"Error extracting NeurIPS year: {e}")
+    
+    # Extract authors
+    try:
+        # Try to find the authors section
+        authors_p = page.query_selector('h4:has-text("Authors") + p')
+        if authors_p:
+            authors_text = authors_p.text_content().strip()
+            # Remove italic formatting if present
+            authors_text = authors_text.replace('<i>', '').replace('</i>', '')
+            # Split by commas and handle possible "and" between last two authors
+            if ' and ' in authors_text:
+                parts = authors_text.split(' and ')
+                if ',' in parts[0]:
+                    # There are multiple authors with commas
+                    authors_before_and = parts[0].split(',')
+                    authors = [a.strip() for a in authors_before_and] + [parts[1].strip()]
+                else:
+                    # Just two authors separated by "and"
+                    authors = [parts[0].strip(), parts[1].strip()]
+            else:
+                # Split by commas
+                authors = [a.strip() for a in authors_text.split(',')]
+            
+            # Filter out empty strings and remove any HTML tags
+            authors = [re.sub(r'<[^>]+>', '', a) for a in authors if a]
+            info['authors'] = authors if authors else None
+    except Exception as e:
+        logging.warning(f"Error extracting NeurIPS authors: {e}")
+    
+    # Extract abstract
+    try:
+        # Find the abstract section
+        abstract_p = page.query_selector('h4:has-text("Abstract") + p')
+        if abstract_p:
+            abstract_text = abstract_p.text_content().strip()
+            # Clean up MathJax elements if needed
+            abstract_text = re.sub(r'<span class="MathJax[^>]+>.*?</span>', '', abstract_text)
+            info['abstract'] = abstract_text
+    except Exception as e:
+        logging.warning(f"Error extracting NeurIPS abstract: {e}")
+    
+    return info
+
 
 def get_url_type(urls):
     type = None
@@ -596,69 +839,115 @@ def get_url_type(urls):
         return type, v
 
 
+# Define handler configuration
+handlers = [
+    {
+        'type': 'arxiv',
+        'url_pattern': r'arxiv\.org/abs/(\d+\.\d+)',
+        'id_group': 1,
+        'info_func': get_arxiv_info,
+        'async_info_func': get_arxiv_info_async,
+        'extract_func': extract_arxiv_info,
+        'selectors': ARXIV_SELECTORS
+    },
+    {
+        'type': 'openreview',
+        'url_pattern': r'id=([A-Za-z0-9]+)$',
+        'id_group': 1,
+        'info_func': get_openreview_info,
+        'async_info_func': get_openreview_info_async,
+        'extract_func': extract_openreview_info,
+        'selectors': OPENREVIEW_SELECTORS
+    },
+    {
+        'type': 'acl',
+        'url_pattern': r'aclanthology\.org/([A-Z0-9\-\.]+)/?$',
+        'id_group': 1,
+        'info_func': get_acl_info,
+        'async_info_func': get_acl_info_async,
+        'extract_func': extract_acl_info,
+        'selectors': ACL_SELECTORS
+    },
+    {
+        'type': 'mlr',
+        'url_pattern': r'proceedings\.mlr\.press/([a-zA-Z0-9\/\-]+)',
+        'id_group': 1,
+        'info_func': get_mlr_info,
+        'async_info_func': get_mlr_info_async,
+        'extract_func': extract_mlr_info,
+        'selectors': MLR_SELECTORS
+    },
+    {
+        'type': 'neurips',
+        'url_pattern': r'neurips\.cc/paper_files/paper/(\d+/[^/]+/[^/]+)',
+        'id_group': 1,
+        'info_func': get_neurips_info,
+        'async_info_func': get_neurips_info_async,
+        'extract_func': extract_neurips_info,
+        'selectors': NEURIPS_SELECTORS
+    }
+]
+
+
+def extract_id(pattern, url, group):
+    match = re.search(pattern, url)
+    return match.group(group) if match else None
+
+
+def merge_paper_info(paper, info):
+    updated = False
+    for field in ['date', 'authors', 'abstract']:
+        if not paper.get(field) and info.get(field):
+            paper[field] = info[field]
+            updated = True
+    return updated
+
+
+def find_handler(paper):
+    """Return (handler, paper_id) for a paper that still needs info, or None.
+
+    Shared by both backends so they pick the same venue and id for every paper.
+    """
+    if all(paper.get(field) for field in ['date', 'authors', 'abstract']):
+        return None
+
+    urls = paper.get('urls', {})
+    type, url = get_url_type(urls)
+
+    for handler in handlers:
+        if type != handler['type']:
+            continue
+
+        try:
+            paper_id = extract_id(handler['url_pattern'], url, handler['id_group'])
+            if paper_id:
+                return handler, paper_id
+        except Exception as e:
+            logging.error(f"Error processing {handler['type'].title()} URL {url}: {e}")
+
+    return None
+
+
 def update_paper_info(paper):
     try:
-        if all(paper.get(field) for field in ['date', 'authors', 'abstract']):
-            return paper
-
-        urls = paper.get('urls', {})
-        type, url = get_url_type(urls)
-        updated = False
-
-        # Define handler configuration
-        handlers = [
-            {
-                'type': 'arxiv',
-                'url_pattern': r'arxiv\.org/abs/(\d+\.\d+)',
-                'id_group': 1,
-                'info_func': get_arxiv_info
-            },
-            {
-                'type': 'openreview',
-                'url_pattern': r'id=([A-Za-z0-9]+)$',
-                'id_group': 1,
-                'info_func': get_openreview_info
-            },
-            {
-                'type': 'acl',
-                'url_pattern': r'aclanthology\.org/([A-Z0-9\-\.]+)/?$',
-                'id_group': 1,
-                'info_func': get_acl_info
-            },
-            {
-                'type': 'mlr',
-                'url_pattern': r'proceedings\.mlr\.press/([a-zA-Z0-9\/\-]+)',
-                'id_group': 1,
-                'info_func': get_mlr_info
-            },
-            {
-                'type': 'neurips',
-                'url_pattern': r'neurips\.cc/paper_files/paper/(\d+/[^/]+/[^/]+)',
-                'id_group': 1,
-                'info_func': get_neurips_info
-            }
-        ]
+        if match := find_handler(paper):
+            handler, paper_id = match
+            if info := handler['info_func'](paper_id):
+                merge_paper_info(paper, info)
 
-        def extract_id(pattern, url, group):
-            match = re.search(pattern, url)
-            return match.group(group) if match else None
+        return paper
 
-        for handler in handlers:
-            if updated or type != handler['type']:
-                continue
-                
-            try:
-                paper_id = extract_id(handler['url_pattern'], url, handler['id_group'])
-                if not paper_id:
-                    continue
-                
-                if info := handler['info_func'](paper_id):
-                    for field in ['date', 'authors', 'abstract']:
-                        if not paper.get(field) and info.get(field):
-                            paper[field] = info[field]
-                            updated = True
-            except Exception as e:
-                logging.error(f"Error processing {handler['type'].title()} URL {url}: {e}")
+    except Exception as e:
+        logging.error(f"Error updating paper {paper.get('id')}: {e}")
+        return paper
+
+
+async def update_paper_info_async(paper, browser):
+    try:
+        if match := find_handler(paper):
+            handler, paper_id = match
+            if info := await handler['async_info_func'](paper_id, browser):
+                merge_paper_info(paper, info)
 
         return paper
 
@@ -667,16 +956,59 @@ def update_paper_info(paper):
         return paper
 
 
+def captured_selectors(selectors):
+    names = set(selectors)
+    for options in selectors.values():
+        names |= captured_selectors(options.get('children', {}))
+    return names
+
+
+def check_snapshot_selectors():
+    """Raise ValueError if an extract_*_info function reads a selector missing from its *_SELECTORS.
+
+    The snapshot would raise KeyError for it, dropping that field only on the async path.
+    """
+    for handler in handlers:
+        source = inspect.getsource(handler['extract_func'])
+        used = {match.group(2) for match in re.finditer(r'query_selector(?:_all)?\((["\'])(.*?)\1\)', source)}
+        missing = used - captured_selectors(handler['selectors'])
+        if missing:
+            raise ValueError(f"{handler['extract_func'].__name__} reads selectors not captured for the async backend: {sorted(missing)}")
+
+
+async def update_papers_async(papers):
+    """Update all papers concurrently; each venue's limiter bounds its in-flight page loads."""
+    check_snapshot_selectors()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=False)
+        try:
+            with tqdm(total=len(papers), desc="Updating paper info") as progress:
+                async def update_one(paper):
+                    result = await update_paper_info_async(paper, browser)
+                    progress.update(1)
+                    return result
+
+                # gather keeps the input order, so the output matches the sync backend
+                return await asyncio.gather(*(update_one(paper) for paper in papers))
+        finally:
+            await browser.close()
+
+
 
 if __name__ == "__main__":
+    # Pass --async to fetch pages concurrently across venues
+    use_async = '--async' in sys.argv[1:]
     try:
         with open('papers.json', 'r') as f:
             papers = json.load(f)
         
         logging.info(f"Processing {len(papers)} papers...")
-        updated_papers = []
-        for paper in tqdm(papers, desc="Updating paper info"):
-            updated_papers.append(update_paper_info(paper))
+        if use_async:
+            updated_papers = asyncio.run(update_papers_async(papers))
+        else:
+            updated_papers = []
+            for paper in tqdm(papers, desc="Updating paper info"):
+                updated_papers.append(update_paper_info(paper))
         
         with open('papers_updated.json', 'w') as f:
             json.dump(updated_papers, f, indent=2, ensure_ascii=False)
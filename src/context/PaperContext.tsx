@@ -1,6 +1,7 @@
 import React, { createContext, useContext, useState, useEffect, ReactNode, useMemo } from 'react';
 import Fuse from 'fuse.js';
-import { Paper, Tag, FilterState } from '../types';
+import { Paper, Tag, FilterState, SortIndex } from '../types';
+import { fingerprintPapers } from '../utils/sortUtils';
 
 interface PaperContextType {
   papers: Paper[];
@@ -66,6 +67,9 @@ const tagMap: Record<string, string[]> = {
   'APP_RED': ['Application/Redundancy']
 };
 
+// Must match SORT_INDEX_VERSION in public/data/build_sort_index.py
+const SORT_INDEX_VERSION = 2;
+
 const PaperContext = createContext<PaperContextType | undefined>(undefined);
 
 export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) => {
@@ -73,6 +77,7 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
   const [tags, setTags] = useState<Tag[]>([]);
   const [filters, setFilters] = useState<FilterState>(defaultFilters);
   const [filteredPapers, setFilteredPapers] = useState<Paper[]>([]);
+  const [sortIndex, setSortIndex] = useState<SortIndex | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   
   // Fetch papers and tags
@@ -83,13 +88,16 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
         // Use the correct paths for GitHub Pages deployment
         const papersUrl = process.env.PUBLIC_URL + '/data/papers.json';
         const tagsUrl = process.env.PUBLIC_URL + '/data/tags.json';
+        const sortIndexUrl = process.env.PUBLIC_URL + '/data/sort_index.json';
         
         console.log('Fetching papers from:', papersUrl);
         console.log('Fetching tags from:', tagsUrl);
         
-        const [papersResponse, tagsResponse] = await Promise.all([
+        const [papersResponse, tagsResponse, sortIndexResponse] = await Promise.all([
           fetch(papersUrl),
-          fetch(tagsUrl)
+          fetch(tagsUrl),
+          // The sort index is optional; without it papers are sorted in the browser
+          fetch(sortIndexUrl).catch(() => null)
         ]);
         
         if (!papersResponse.ok) {
@@ -108,6 +116,20 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
         console.log('Fetched papers:', papersData);
         console.log('Fetched tags:', tagsData);
         
+        // Ignore a sort index built from a different papers.json or tags.json
+        if (sortIndexResponse && sortIndexResponse.ok) {
+          const sortIndexData: SortIndex = await sortIndexResponse.json();
+          if (
+            sortIndexData.version === SORT_INDEX_VERSION &&
+            sortIndexData.count === papersData.length &&
+            sortIndexData.fingerprint === fingerprintPapers(papersData, tagsData)
+          ) {
+            setSortIndex(sortIndexData);
+          } else {
+            console.warn('Ignoring stale sort index; run public/data/build_sort_index.py to regenerate it');
+          }
+        }
+        
         setPapers(papersData);
         setTags(tagsData);
       } catch (error) {
@@ -155,6 +177,20 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
     return 0;
   };
   
+  // Position of each paper in papers.json, which the sort index refers to
+  const paperPositions = useMemo(() => new Map(papers.map((paper, index) => [paper, index] as [Paper, number])), [papers]);
+  
+  // Reorder a subset of papers by a precomputed permutation of papers.json indices
+  const applySortOrder = (order: number[], subset: Paper[]): Paper[] => {
+    const included = new Set(subset);
+    return order.map(index => papers[index]).filter(paper => included.has(paper));
+  };
+  
+  // Newest first; the sort is stable, so search results keep their relevance order within a date
+  const sortByDateKey = (dateKeys: number[], subset: Paper[]): Paper[] => {
+    return subset.sort((a, b) => dateKeys[paperPositions.get(b)!] - dateKeys[paperPositions.get(a)!]);
+  };
+  
   // Apply filters and sorting
   useEffect(() => {
     console.log('Filtering papers. Current papers:', papers.length);
@@ -212,17 +248,32 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
     // Apply sorting
     switch (filters.sortOption) {
       case 'newest':
-        result.sort((a, b) => compareDates(a.date, b.date));
+        if (sortIndex && filters.searchTerm) {
+          result = sortByDateKey(sortIndex.dateKeys, result);
+        } else if (sortIndex) {
+          result = applySortOrder(sortIndex.orders['newest'], result);
+        } else {
+          result.sort((a, b) => compareDates(a.date, b.date));
+        }
         break;
       case 'relevance':
         // Relevance sorting is already handled by Fuse.js when searching
         // If not searching, fall back to newest
         if (!filters.searchTerm) {
-          result.sort((a, b) => compareDates(a.date, b.date));
+          if (sortIndex) {
+            result = applySortOrder(sortIndex.orders['newest'], result);
+          } else {
+            result.sort((a, b) => compareDates(a.date, b.date));
+          }
         }
         break;
       case 'tag-based':
       default:
+        if (sortIndex) {
+          result = applySortOrder(sortIndex.orders['tag-based'], result);
+          break;
+        }
+        
         // Group by parent tag - extract parent from primaryTag
         const tagGroups: Record<string, Paper[]> = {};
         result.forEach(paper => {
@@ -285,7 +336,7 @@ export const PaperProvider: React.FC<{ children: ReactNode }> = ({ children }) =
     
     console.log('Filtered papers result:', result.length);
     setFilteredPapers(result);
-  }, [papers, filters, fuse, tags]);
+  }, [papers, filters, fuse, tags, sortIndex, paperPositions]);
   
   // Toggle tag selection
   const toggleTag = (tagId: string) => {
@@ -28,4 +28,13 @@ export interface FilterState {
   sortOption: SortOption;
   selectedTags: string[];
   primaryTagOnly: boolean;
-} 
\ No newline at end of file
+}
+
+// Precomputed by public/data/build_sort_index.py; indices refer to positions in papers.json
+export interface SortIndex {
+  version: number;
+  count: number;
+  fingerprint: number;
+  dateKeys: number[];
+  orders: Record<'newest' | 'tag-based', number[]>;
+}
@@ -0,0 +1,36 @@
+/**
+ * @jest-environment node
+ */
+import { Paper, Tag } from '../types';
+import { fingerprintPapers } from './sortUtils';
+
+const makePaper = (date: string, primaryTag: string, title: string): Paper => ({
+  id: 0,
+  title,
+  tags: [],
+  primaryTag,
+  date,
+  authors: [],
+  abstract: '',
+  urls: {}
+});
+
+const papers: Paper[] = [
+  makePaper('2024-01', 'Techniques/Probing', 'Probing "quoted" C:\\path'),
+  makePaper('', 'Ability/General', 'Über naïve — circuits')
+];
+
+const tags: Tag[] = [
+  { id: 'TEC', name: 'Techniques', children: [{ id: 'TEC_PRO', name: 'Probing' }] },
+  { id: 'ABI', name: 'Ability', children: [{ id: 'ABI_GEN', name: 'General' }] }
+];
+
+// Expected values come from papers_fingerprint() in public/data/build_sort_index.py
+test('fingerprint matches the Python build script', () => {
+  expect(fingerprintPapers(papers, tags)).toBe(1976697818);
+  expect(fingerprintPapers([], [])).toBe(3498527149);
+});
+
+test('fingerprint changes when tags are reordered', () => {
+  expect(fingerprintPapers(papers, [...tags].reverse())).toBe(2942281118);
+});
@@ -0,0 +1,16 @@
+import { Paper, Tag } from '../types';
+
+// 32-bit FNV-1a hash of everything the precomputed sort orders read: the date,
+// primaryTag and title of every paper plus the ordered parent and child tag names.
+// Must match papers_fingerprint() in public/data/build_sort_index.py
+export const fingerprintPapers = (papers: Paper[], tags: Tag[]): number => {
+  const paperFields = papers.map(paper => [paper.date || '', paper.primaryTag || '', paper.title || '']);
+  const tagFields = tags.map(tag => [tag.name || '', (tag.children || []).map(child => child.name || '')]);
+  const bytes = new TextEncoder().encode(JSON.stringify([paperFields, tagFields]));
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < bytes.length; i++) {
+    hash ^= bytes[i];
+    hash = Math.imul(hash, 0x01000193) >>> 0;
+  }
+  return hash >>> 0;
+};